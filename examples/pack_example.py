@@ -4,13 +4,16 @@ from loguru import logger
 import sys
 
 # Assuming the LoguruWidget class is in a file named loguru_widget.py
-from tkloguru import LoguruWidget, setup_logger
+from tkloguru import LEVELS, LoguruWidget, setup_logger
 
 class LoguruWidgetPackExample:
     """
     An example application demonstrating the use of LoguruWidget with pack layout.
     """
 
+    _NEXT_COLOR_MODE = {"level": "full", "full": "message", "message": "level"}
+    _NEXT_LEVEL = dict(zip(LEVELS, LEVELS[1:] + LEVELS[:1]))
+
     def __init__(self, root):
         """
         Initialize the example application.
@@ -65,8 +68,7 @@ class LoguruWidgetPackExample:
 
     def change_color_mode(self):
         """Change the color mode of the log widget."""
-        current_mode = self.log_widget.color_mode
-        new_mode = 'full' if current_mode == 'level' else 'level' if current_mode == 'message' else 'message'
+        new_mode = self._NEXT_COLOR_MODE[self.log_widget.color_mode]
         self.log_widget.color_mode = new_mode
         
         logger.info(f"Changed color mode to: {new_mode}")
@@ -74,10 +76,7 @@ class LoguruWidgetPackExample:
     def change_log_level(self):
         """Change the logging level of the log widget."""
         current_level = self.log_widget.get_logging_level()
-        levels = ["TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"]
-        current_index = levels.index(current_level)
-        new_index = (current_index + 1) % len(levels)
-        new_level = levels[new_index]
+        new_level = self._NEXT_LEVEL[current_level]
         
         self.log_widget.set_logging_level(new_level)
         logger.log(new_level, f"Changed logging level from {current_level} to: {new_level}")
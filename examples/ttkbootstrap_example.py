@@ -2,12 +2,14 @@ import warnings
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="ttkbootstrap.localization.msgs")
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from tkloguru import LoguruWidget, setup_logger
+from tkloguru import LEVELS, LoguruWidget, setup_logger
 from loguru import logger
 import threading
 import time
 
 class TkLoguruDemo(ttk.Window):
+    _NEXT_LEVEL = dict(zip(LEVELS, LEVELS[1:] + LEVELS[:1]))
+
     def __init__(self):
         super().__init__(themename="darkly")
         self.title("TkLoguru with ttkbootstrap Demo")
@@ -80,15 +82,8 @@ class TkLoguruDemo(ttk.Window):
             time.sleep(0.5)
 
     def change_log_level(self):
-        levels = ["TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"]
-        level_no_to_name = {5: "TRACE", 10: "DEBUG", 20: "INFO", 25: "SUCCESS", 30: "WARNING", 40: "ERROR", 50: "CRITICAL"}
-        
-        current_level_no = logger._core.min_level
-        current_level = level_no_to_name.get(current_level_no, "INFO")  # Default to INFO if level is not found
-        
-        current_index = levels.index(current_level)
-        new_index = (current_index + 1) % len(levels)
-        new_level = levels[new_index]
+        current_level = self.log_widget.get_logging_level()
+        new_level = self._NEXT_LEVEL[current_level]
         
         self.log_widget.set_logging_level(new_level)
         
@@ -0,0 +1,361 @@
+import logging
+import sys
+import time
+import tkinter
+import unittest
+from collections import deque
+from datetime import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+from loguru import logger
+
+import tkloguru
+from tkloguru import LoggingInterceptHandler, LoguruWidget, _coalesce, _format_epoch, _make_record, setup_logger
+
+TIME_STR = "2024-01-01 12:00:00"
+
+
+def baseline_segments(color_mode, time_str, level, message):
+    """Return the `(text, tag)` inserts the original per-record `update_widget` made."""
+    if color_mode == 'full':
+        return [(f"{time_str} | {level:8} | {message}\n", level)]
+    if color_mode == 'message':
+        return [(f"{time_str} | {level:8} | ", ""), (f"{message}\n", level)]
+    return [(f"{time_str} | ", ""), (f"{level:8}", level), (f" | {message}\n", "")]
+
+
+def tagged_chars(args):
+    """Expand interleaved `Text.insert` arguments into one `(char, tag)` pair per character."""
+    return [(char, tag) for text, tag in zip(args[::2], args[1::2]) for char in text]
+
+
+class FakeText:
+    """Records the calls `LoguruWidget._flush` makes on its text widget."""
+
+    def __init__(self):
+        self.inserted = []
+        self.deleted = []
+
+    def configure(self, **kwargs):
+        pass
+
+    def yview(self):
+        return (0.0, 1.0)
+
+    def insert(self, index, *args):
+        self.inserted.append(args)
+
+    def delete(self, start, end):
+        self.deleted.append((start, end))
+
+    def see(self, index):
+        pass
+
+
+def bare_widget(max_lines=10, viewable=True):
+    """
+    Return a `LoguruWidget` that was never attached to Tk.
+
+    Tk calls are replaced by recorders: `after` delays are collected in `polls`, `after_idle`
+    callbacks in `idle` and flushed batches in `flushed`, so the queue logic runs without a display.
+    """
+    widget = object.__new__(LoguruWidget)
+    widget.__dict__.update(
+        queue=deque(maxlen=max_lines), _records=deque(maxlen=max_lines), _unrendered=0,
+        max_lines=max_lines, _max_insert_per_tick=500, _flush_pending=False, _is_destroyed=False,
+        _poll_interval_ms=100, _max_poll_interval_ms=400, _next_poll_ms=100, _line_count=0, _min_level_no=0, _current_level='DEBUG',
+        _handler_id=None, _sink_options={}, _intercept_handler=None, intercept_logging=False,
+        viewable=viewable, idle=[], flushed=[], cleared=0,
+    )
+    widget.winfo_viewable = lambda: widget.viewable
+    widget.polls = []
+    widget.after = lambda ms, *args: widget.polls.append(ms)
+    widget.after_idle = lambda *args: widget.idle.append(args)
+    widget._flush = widget.flushed.append
+
+    def clear_text():
+        widget.cleared += 1
+    widget._clear_text = clear_text
+    return widget
+
+
+class TagColorsTest(unittest.TestCase):
+
+    def test_colors_are_passed_to_tcl_verbatim(self):
+        interp = tkinter.Tcl()
+        interp.eval("proc {.log text} {args} {lappend ::calls $args}")
+        widget = object.__new__(LoguruWidget)
+        widget.text = type("Text", (), {"tk": interp, "__str__": lambda self: ".log text"})()
+        widget.log_colors = {"INFO": "#3498db", "ODD{LEVEL": ("white", "dark\\red }")}
+        widget.update_tag_colors()
+        self.assertEqual(interp.splitlist(interp.getvar("calls")), (
+            ("tag", "configure", "INFO", "-foreground", "#3498db"),
+            ("tag", "configure", "ODD{LEVEL", "-foreground", "white", "-background", "dark\\red }"),
+        ))
+
+
+class MakeRecordTest(unittest.TestCase):
+
+    def test_level_offsets(self):
+        line, level, start, end = _make_record(TIME_STR, "INFO", "hello")
+        self.assertEqual(line, f"{TIME_STR} | INFO     | hello\n")
+        self.assertEqual(level, "INFO")
+        self.assertEqual(line[start:end], "INFO    ")
+
+    def test_custom_level_longer_than_padding(self):
+        line, _, start, end = _make_record(TIME_STR, "NOTIFICATION", "hello")
+        self.assertEqual(line[start:end], "NOTIFICATION")
+        self.assertEqual(line[end:], " | hello\n")
+
+
+class FormatterTest(unittest.TestCase):
+
+    records = [
+        (TIME_STR, "INFO", "first"),
+        (TIME_STR, "INFO", "second"),
+        (TIME_STR, "ERROR", "multi\nline"),
+        (TIME_STR, "NOTIFICATION", "custom"),
+    ]
+
+    def assert_matches_baseline(self, color_mode, args):
+        expected = [seg for record in self.records for seg in baseline_segments(color_mode, *record)]
+        self.assertEqual(tagged_chars(args), tagged_chars([x for seg in expected for x in seg]))
+
+    def test_level_chunks_match_baseline(self):
+        records = [_make_record(*record) for record in self.records]
+        self.assert_matches_baseline('level', _coalesce(LoguruWidget._level_chunks(records)))
+
+    def test_message_chunks_match_baseline(self):
+        records = [_make_record(*record) for record in self.records]
+        self.assert_matches_baseline('message', _coalesce(LoguruWidget._message_chunks(records)))
+
+    def test_full_matches_baseline(self):
+        records = [_make_record(*record) for record in self.records]
+        self.assert_matches_baseline('full', LoguruWidget._format_full(records))
+
+    def test_full_groups_consecutive_levels(self):
+        records = [_make_record(*record) for record in self.records]
+        args = LoguruWidget._format_full(records)
+        self.assertEqual(args[1::2], ["INFO", "ERROR", "NOTIFICATION"])
+        self.assertEqual(args[0], records[0][0] + records[1][0])
+
+    def test_coalesce_merges_adjacent_tags(self):
+        chunks = [("a", ""), ("b", ""), ("c", "INFO"), ("d", "INFO"), ("e", "")]
+        self.assertEqual(_coalesce(chunks), ["ab", "", "cd", "INFO", "e", ""])
+        self.assertEqual(_coalesce([]), [])
+
+
+class FlushTest(unittest.TestCase):
+
+    def make_widget(self, max_lines, line_count=0):
+        return SimpleNamespace(text=FakeText(), max_lines=max_lines, _line_count=line_count,
+                               _formatter=LoguruWidget._format_full)
+
+    def test_no_trim_below_max_lines(self):
+        widget = self.make_widget(max_lines=10)
+        LoguruWidget._flush(widget, [_make_record(TIME_STR, "INFO", str(i)) for i in range(3)])
+        self.assertEqual(widget._line_count, 3)
+        self.assertEqual(widget.text.deleted, [])
+
+    def test_trims_overflow_in_one_delete(self):
+        widget = self.make_widget(max_lines=5, line_count=4)
+        LoguruWidget._flush(widget, [_make_record(TIME_STR, "INFO", str(i)) for i in range(3)])
+        self.assertEqual(widget.text.deleted, [('1.0', '3.0')])
+        self.assertEqual(widget._line_count, 5)
+
+    def test_counts_lines_of_multiline_messages(self):
+        widget = self.make_widget(max_lines=5, line_count=3)
+        LoguruWidget._flush(widget, [_make_record(TIME_STR, "ERROR", "a\nb\nc")])
+        self.assertEqual(widget.text.deleted, [('1.0', '2.0')])
+        self.assertEqual(widget._line_count, 5)
+
+
+class FormatEpochTest(unittest.TestCase):
+
+    def test_matches_strftime_and_caches_per_second(self):
+        now = time.time()
+        expected = time.strftime(tkloguru.TIME_FORMAT, time.localtime(int(now)))
+        self.assertEqual(_format_epoch(now), expected)
+        self.assertIs(_format_epoch(int(now) + 0.5), _format_epoch(now))
+        self.assertEqual(tkloguru._format_time(datetime.fromtimestamp(now)), expected)
+
+
+class InterceptHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.widget = SimpleNamespace(queue=deque())
+        self.handler = LoggingInterceptHandler(self.widget)
+
+    def make_record(self, msg, args=None, exc_info=None):
+        return logging.LogRecord("test", logging.WARNING, __file__, 1, msg, args, exc_info)
+
+    def test_plain_record_uses_get_message(self):
+        self.handler.handle(self.make_record("value=%d", (42,)))
+        line, level, _, _ = self.widget.queue[0]
+        self.assertEqual(level, "WARNING")
+        self.assertTrue(line.endswith(" | WARNING  | value=42\n"))
+
+    def test_exc_info_goes_through_format(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = self.make_record("failed", exc_info=sys.exc_info())
+        self.handler.handle(record)
+        line = self.widget.queue[0][0]
+        self.assertIn(" | failed\nTraceback (most recent call last):", line)
+        self.assertIn("ValueError: boom", line)
+
+    def test_custom_formatter_is_used(self):
+        self.handler.setFormatter(logging.Formatter("[%(name)s] %(message)s"))
+        self.handler.handle(self.make_record("hello"))
+        self.assertTrue(self.widget.queue[0][0].endswith(" | [test] hello\n"))
+
+
+class QueuePollTest(unittest.TestCase):
+
+    def test_poll_renders_backlog_buffered_while_hidden(self):
+        widget = bare_widget(viewable=False)
+        widget.queue.append(_make_record(TIME_STR, "INFO", "hidden"))
+        widget.check_queue()
+        self.assertEqual(widget.flushed, [])
+        self.assertEqual(widget._unrendered, 1)
+
+        # Shown again without a <Map> on the frame itself: the next poll must still render it.
+        widget.viewable = True
+        widget.check_queue()
+        self.assertEqual(len(widget.flushed), 1)
+        self.assertEqual(widget.flushed[0][0][0], f"{TIME_STR} | INFO     | hidden\n")
+        self.assertEqual(widget._unrendered, 0)
+
+    def test_poll_with_nothing_pending_does_no_work(self):
+        widget = bare_widget()
+        widget.winfo_viewable = None  # would raise if the poll touched Tk
+        widget.check_queue()
+        self.assertEqual(widget.flushed, [])
+
+    def test_poll_backs_off_while_idle_and_resets_on_records(self):
+        widget = bare_widget()
+        for _ in range(4):
+            widget.check_queue()
+        self.assertEqual(widget.polls, [200, 400, 400, 400])
+        widget.queue.append(_make_record(TIME_STR, "INFO", "busy"))
+        widget.check_queue()
+        self.assertEqual(widget.polls[-1], 100)
+
+
+class FlushQueueTest(unittest.TestCase):
+
+    def records(self, count, start=0):
+        return [_make_record(TIME_STR, "INFO", str(i)) for i in range(start, start + count)]
+
+    def test_large_backlog_is_split_across_idle_flushes(self):
+        widget = bare_widget(max_lines=100)
+        widget._max_insert_per_tick = 3
+        widget.queue.extend(self.records(5))
+        widget._flush_queue()
+        self.assertEqual(widget.flushed, [self.records(3)])
+        self.assertTrue(widget._flush_pending)
+        self.assertEqual(widget.idle, [(widget._do_flush,)])
+
+        callback, = widget.idle.pop()
+        callback()
+        self.assertEqual(widget.flushed[1], self.records(2, start=3))
+        self.assertFalse(widget._flush_pending)
+        self.assertEqual(widget.idle, [])
+
+    def test_hidden_records_are_rendered_in_order_once_shown(self):
+        widget = bare_widget(viewable=False)
+        widget.queue.extend(self.records(3))
+        widget._flush_queue()
+        widget.viewable = True
+        widget.queue.extend(self.records(2, start=3))
+        widget._flush_queue()
+        self.assertEqual(widget.flushed, [self.records(5)])
+        self.assertEqual(widget.cleared, 0)
+
+    def test_backlog_of_max_lines_rebuilds_the_view(self):
+        widget = bare_widget(max_lines=10, viewable=False)
+        for record in self.records(15):
+            widget.queue.append(record)
+            widget._flush_queue()
+        widget.viewable = True
+        widget._flush_queue()
+        self.assertEqual(widget.cleared, 1)
+        self.assertEqual(widget.flushed, [self.records(10, start=5)])
+
+    def test_update_widget_does_not_repeat_hidden_records(self):
+        widget = bare_widget(viewable=False)
+        widget.queue.extend(self.records(2))
+        widget._flush_queue()
+        widget.viewable = True
+        widget.update_widget({"time": datetime(2024, 1, 1, 12), "level": "INFO", "message": "2"})
+        self.assertEqual(len(widget.flushed), 1)
+        self.assertEqual([record[0][-2:] for record in widget.flushed[0]], ["0\n", "1\n", "2\n"])
+
+
+class HandlerLifecycleTest(unittest.TestCase):
+
+    def setUp(self):
+        logger.remove()
+
+    def tearDown(self):
+        logger.remove()
+
+    def test_set_logging_level_replaces_only_own_handler(self):
+        widget = bare_widget()
+        setup_logger(widget)
+        other_id = logger.add(lambda message: None)
+        old_id = widget._handler_id
+        widget.set_logging_level('WARNING')
+        self.assertEqual(set(logger._core.handlers), {other_id, widget._handler_id})
+        self.assertNotEqual(widget._handler_id, old_id)
+        self.assertEqual(widget.get_logging_level(), 'WARNING')
+        logger.info("dropped")
+        logger.warning("kept")
+        logger.complete()
+        self.assertEqual([record[1] for record in widget.queue], ["WARNING"])
+
+    def test_set_logging_level_with_stale_handler_id(self):
+        first, second = bare_widget(), bare_widget()
+        setup_logger(first)
+        setup_logger(second)  # removes every handler, including the first widget's
+        first.set_logging_level('INFO')
+        self.assertEqual(set(logger._core.handlers), {first._handler_id, second._handler_id})
+
+    def test_destroy_with_stale_handler_id_still_destroys(self):
+        first, second = bare_widget(), bare_widget()
+        setup_logger(first)
+        setup_logger(second)  # removes every handler, including the first widget's
+        with mock.patch.object(tkinter.BaseWidget, "destroy") as base_destroy:
+            first.destroy()
+        base_destroy.assert_called_once_with()
+        self.assertIsNone(first._handler_id)
+        self.assertEqual(list(logger._core.handlers), [second._handler_id])
+
+    def test_destroying_one_widget_leaves_the_other_logging(self):
+        first, second = bare_widget(), bare_widget()
+        setup_logger(first)
+        setup_logger(second)
+        first.set_logging_level('DEBUG')  # re-registers the first widget next to the second
+        with mock.patch.object(tkinter.BaseWidget, "destroy"):
+            first.destroy()
+        logger.info("after")
+        logger.complete()
+        self.assertEqual(list(logger._core.handlers), [second._handler_id])
+        self.assertEqual(len(first.queue), 0)
+        self.assertEqual(len(second.queue), 1)
+
+    def test_destroy_unregisters_handlers(self):
+        widget = bare_widget()
+        widget.intercept_logging = True
+        setup_logger(widget)
+        intercept_handler = widget._intercept_handler
+        with mock.patch.object(tkinter.BaseWidget, "destroy"):
+            widget.destroy()
+        self.assertEqual(list(logger._core.handlers), [])
+        self.assertNotIn(intercept_handler, logging.getLogger().handlers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,107 @@
 import tkinter as tk
 from tkinter import ttk
-import queue
 from loguru import logger
 import sys
 import threading
 import logging
-from datetime import datetime
+from collections import deque
+from itertools import groupby
+from operator import itemgetter
+import time
 
 LEVELS = ["TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"]
 LEVEL_NO_TO_NAME = {5: "TRACE", 10: "DEBUG", 20: "INFO", 25: "SUCCESS", 30: "WARNING", 40: "ERROR", 50: "CRITICAL"}
+COLOR_MODES = {'level': 0, 'message': 1, 'full': 2}
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Level names padded to the display column width, so lines need no per-record format spec.
+_PADDED_LEVELS = {level: f"{level:<8}" for level in LEVELS}
+# Right-gravity mark kept at the end of the log text; new records are inserted here.
+_LOG_END = "log_end"
+# Tcl lambda for `apply` that runs `tag configure` on widget `w` for each (tag, options) pair in `tags`.
+_CONFIGURE_TAGS = ("w tags", "foreach {tag options} $tags {$w tag configure $tag {*}$options}")
+
+# (epoch second, formatted string) of the last timestamp formatted by `_format_epoch`.
+_last_time = (None, "")
+
+def _format_epoch(seconds):
+    """
+    Format a POSIX timestamp in local time with TIME_FORMAT, reusing the previous result within the same second.
+
+    Args:
+        seconds (float): Seconds since the epoch.
+
+    Returns:
+        str: The formatted timestamp.
+    """
+    global _last_time
+    sec = int(seconds)
+    cached_sec, cached_str = _last_time
+    if sec != cached_sec:
+        cached_str = time.strftime(TIME_FORMAT, time.localtime(sec))
+        # Swapped as a single tuple so concurrent producers never see a mismatched pair.
+        _last_time = (sec, cached_str)
+    return cached_str
+
+def _format_time(dt):
+    """
+    Format a datetime with TIME_FORMAT in local time.
+
+    Args:
+        dt (datetime): The timestamp to format.
+
+    Returns:
+        str: The formatted timestamp.
+    """
+    return _format_epoch(dt.timestamp())
+
+def _make_record(time_str, level, message):
+    """
+    Build the queued form of a log record: its finished display line plus split points.
+
+    Args:
+        time_str (str): The formatted timestamp.
+        level (str): The level name, also used as the text tag.
+        message (str): The log message.
+
+    Returns:
+        tuple: `(line, level, level_start, level_end)`, where `line[level_start:level_end]`
+               is the padded level name.
+    """
+    padded = _PADDED_LEVELS.get(level)
+    if padded is None:
+        padded = f"{level:<8}"
+    level_start = len(time_str) + 3
+    level_end = level_start + len(padded)
+    return time_str + " | " + padded + " | " + message + "\n", level, level_start, level_end
+
+def _coalesce(chunks):
+    """
+    Merge consecutive `(text, tag)` chunks that share a tag.
+
+    Args:
+        chunks (iterable): `(text, tag)` pairs in display order.
+
+    Returns:
+        list: Interleaved text and tag arguments, ready to be passed to `Text.insert`.
+    """
+    args = []
+    add_arg = args.append
+    join = "".join
+    run = []
+    add_chunk = run.append
+    run_tag = None
+    for chunk, tag in chunks:
+        if tag != run_tag and run:
+            add_arg(join(run))
+            add_arg(run_tag)
+            run = []
+            add_chunk = run.append
+        run_tag = tag
+        add_chunk(chunk)
+    if run:
+        add_arg(join(run))
+        add_arg(run_tag)
+    return args
 
 class LoggingInterceptHandler(logging.Handler):
     """
@@ -24,6 +117,26 @@ class LoggingInterceptHandler(logging.Handler):
         super().__init__()
         self.widget = widget
 
+    def handle(self, record):
+        """
+        Filter and emit a log record without acquiring the handler lock.
+
+        The widget's queue is safe to append to from any thread, so serializing producers
+        behind `Handler.lock` would only add contention.
+
+        Args:
+            record (logging.LogRecord): The log record to be handled.
+
+        Returns:
+            bool: Whether the record passed the filters and was emitted.
+        """
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
     def emit(self, record):
         """
         Emit a log record by formatting it and sending it to the associated widget.
@@ -32,9 +145,12 @@ class LoggingInterceptHandler(logging.Handler):
             record (logging.LogRecord): The log record to be emitted.
         """
         try:
-            msg = self.format(record)
-            level = record.levelname
-            self.widget.queue.put({"time": datetime.fromtimestamp(record.created), "level": level, "message": msg})
+            if self.formatter is None and not record.exc_info and not record.stack_info:
+                # Same result as the default Formatter without going through it.
+                msg = record.getMessage()
+            else:
+                msg = self.format(record)
+            self.widget.queue.append(_make_record(_format_epoch(record.created), record.levelname, msg))
         except Exception:
             self.handleError(record)
 
@@ -48,40 +164,82 @@ class LoguruWidget(ttk.Frame):
         master (tk.Widget, optional): The parent widget. Defaults to None.
         show_scrollbar (bool, optional): Whether to show a scrollbar. Defaults to True.
         color_mode (str, optional): The coloring mode for log messages. Can be 'level', 'message', or 'full'. Defaults to 'level'.
+                                    'full' is the cheapest mode and is recommended for high-throughput logging.
         max_lines (int, optional): Maximum number of lines to display before starting to remove old ones. Defaults to 1000.
         intercept_logging (bool, optional): Whether to intercept messages from the standard logging module. Defaults to False.
+        wrap (str, optional): How long lines are wrapped: 'none', 'char', or 'word'. 'none' is cheapest since Tk does not
+                              have to look for break points on insert, and adds a horizontal scrollbar when
+                              `show_scrollbar` is set. Defaults to 'none'.
         **kwargs: Additional keyword arguments to pass to the ttk.Frame constructor.
     """
 
-    def __init__(self, master=None, show_scrollbar=True, color_mode='level', max_lines=1000, intercept_logging=False, **kwargs):
+    DEFAULT_LOG_COLORS = {
+        "TRACE": "#999999",
+        "DEBUG": "#4a4a4a",
+        "INFO": "#3498db",
+        "SUCCESS": "#2ecc71",
+        "WARNING": "#f39c12",
+        "ERROR": "#e74c3c",
+        "CRITICAL": ("#ffffff", "#c0392b")
+    }
+
+    def __init__(self, master=None, show_scrollbar=True, color_mode='level', max_lines=1000, intercept_logging=False, wrap='none', **kwargs):
         super().__init__(master, **kwargs)
         self.master = master
-        self.queue = queue.Queue()
         self.show_scrollbar = show_scrollbar
+        self.wrap = wrap
         self.color_mode = color_mode
         self.max_lines = max_lines
+        # A single consumer (the Tk thread) pops while producers append, both of which
+        # are atomic on a deque, so no Queue locking is needed. `maxlen` drops the oldest
+        # records if producers outrun the display; they would be trimmed on insert anyway.
+        self.queue = deque(maxlen=max_lines)
+        # The model: the most recent `max_lines` records, of which the last `_unrendered`
+        # have not been inserted into the text widget yet (e.g. while it was hidden).
+        self._records = deque(maxlen=max_lines)
+        self._unrendered = 0
         self.intercept_logging = intercept_logging
-        self.log_colors = {
-            "TRACE": "#999999",
-            "DEBUG": "#4a4a4a",
-            "INFO": "#3498db",
-            "SUCCESS": "#2ecc71",
-            "WARNING": "#f39c12",
-            "ERROR": "#e74c3c",
-            "CRITICAL": ("#ffffff", "#c0392b")
-        }
+        self._line_count = 0
+        # Records below this severity are dropped in the sink before any formatting happens.
+        self._min_level_no = 0
+        self._current_level = 'DEBUG'
+        self.log_colors = dict(self.DEFAULT_LOG_COLORS)
         self._layout_manager = None
+        self._handler_id = None  # loguru handler id of this widget's sink
+        self._sink_options = {}  # extra `logger.add` options given to `setup_logger`
+        self._intercept_handler = None
+        # The poll runs every `_poll_interval_ms` while records arrive and backs off to
+        # `_max_poll_interval_ms` while the widget is idle.
+        self._poll_interval_ms = 100
+        self._max_poll_interval_ms = 400
+        self._next_poll_ms = self._poll_interval_ms
+        self._flush_pending = False
+        self._flush_interval_ms = 16
+        self._max_insert_per_tick = 500
         self.create_widgets()
         self._is_destroyed = False
-        self.after(100, self.check_queue)
+        self.bind("<Map>", lambda e: self._schedule_flush(), add="+")
+        self.text.bind("<Configure>", lambda e: self._sync_line_count(), add="+")
+        self.after(self._poll_interval_ms, self.check_queue)
 
     def create_widgets(self):
-        """Create and configure the text widget and scrollbar."""
-        self.text = tk.Text(self, wrap=tk.WORD, state=tk.DISABLED)
+        """Create and configure the text widget and scrollbars."""
+        # The log view is read-only: skip undo bookkeeping on every insert and keep the
+        # insertion cursor from blinking, which would otherwise redraw the widget.
+        self.text = tk.Text(self, wrap=self.wrap, state=tk.DISABLED, undo=False, autoseparators=False,
+                            maxundo=0, blockcursor=False, insertofftime=0)
         
         if self.show_scrollbar:
             self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.text.yview)
             self.text.configure(yscrollcommand=self.scrollbar.set)
+        self._show_hscrollbar = self.show_scrollbar and self.wrap == tk.NONE
+        if self._show_hscrollbar:
+            self.hscrollbar = ttk.Scrollbar(self, orient="horizontal", command=self.text.xview)
+            self.text.configure(xscrollcommand=self.hscrollbar.set)
+
+        # Appending at a right-gravity mark keeps it at the end without re-resolving `end`.
+        self.text.mark_set(_LOG_END, tk.END)
+        self.text.mark_gravity(_LOG_END, tk.RIGHT)
         
         self.update_tag_colors()
     
@@ -90,6 +248,8 @@ class LoguruWidget(ttk.Frame):
         if self._layout_manager == "pack":
             if self.show_scrollbar:
                 self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            if self._show_hscrollbar:
+                self.hscrollbar.pack(side=tk.BOTTOM, fill=tk.X)
             self.text.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
         elif self._layout_manager == "grid":
             self.grid_rowconfigure(0, weight=1)
@@ -98,28 +258,94 @@ class LoguruWidget(ttk.Frame):
             if self.show_scrollbar:
                 self.scrollbar.grid(row=0, column=1, sticky="ns")
                 self.grid_columnconfigure(1, weight=0)
+            if self._show_hscrollbar:
+                self.hscrollbar.grid(row=1, column=0, sticky="ew")
+                self.grid_rowconfigure(1, weight=0)
 
     def update_tag_colors(self):
         """Update the color tags for different log levels in the text widget."""
+        # Configure every tag in a single Tcl call rather than one round-trip per level. Tags and
+        # colors are passed as list arguments, so Tcl never parses them as script text.
+        tags = []
         for level, color in self.log_colors.items():
             if isinstance(color, tuple):
-                self.text.tag_configure(level, foreground=color[0], background=color[1])
+                tags.extend((level, ("-foreground", color[0], "-background", color[1])))
             else:
-                self.text.tag_configure(level, foreground=color)
+                tags.extend((level, ("-foreground", color)))
+        self.text.tk.call("apply", _CONFIGURE_TAGS, str(self.text), tuple(tags))
 
     def check_queue(self):
-        """Check the queue for new log messages and update the widget."""
+        """
+        Periodically drain the queue.
+
+        Producers never call into Tk: a blocking call from loguru's writer thread could wait on
+        a Tk thread that is itself blocked handing records to that writer. The Tk thread polls
+        instead, and an empty check on the deque is nearly free. Records buffered while the
+        widget was hidden are also picked up here, since a restored window or a reselected
+        notebook tab does not necessarily map this frame again.
+
+        The interval doubles after each poll that finds nothing to do, up to
+        `_max_poll_interval_ms`, and drops back to `_poll_interval_ms` once records show up.
+        """
         if self._is_destroyed:
             return
         try:
-            while True:
-                record = self.queue.get_nowait()
-                self.update_widget(record)
-        except queue.Empty:
-            pass
+            if self.queue or self._unrendered:
+                self._next_poll_ms = self._poll_interval_ms
+                self._flush_queue()
+            else:
+                self._next_poll_ms = min(self._next_poll_ms * 2, self._max_poll_interval_ms)
         finally:
             if not self._is_destroyed:
-                self.after(100, self.check_queue)
+                self.after(self._next_poll_ms, self.check_queue)
+
+    def _schedule_flush(self):
+        """
+        Schedule a queue drain, coalescing bursts of wake-ups into one flush per frame.
+
+        At most one flush is pending at a time, which caps Text insertions at roughly
+        60 per second regardless of how fast records arrive. Once the interval elapses the
+        drain itself waits for Tk to be idle, so pending input events are handled first.
+        """
+        if not self._flush_pending and not self._is_destroyed:
+            self._flush_pending = True
+            self.after(self._flush_interval_ms, self.after_idle, self._do_flush)
+
+    def _do_flush(self):
+        """Run the flush scheduled by `_schedule_flush`."""
+        self._flush_pending = False
+        self._flush_queue()
+
+    def _flush_queue(self):
+        """
+        Drain pending records from the queue and display them as one batch.
+
+        At most `_max_insert_per_tick` records are taken per call so a large backlog cannot
+        stall the Tk thread; the rest are picked up by another flush once Tk is idle.
+        """
+        if self._is_destroyed:
+            return
+        queue = self.queue
+        popleft = queue.popleft
+        # This is the only consumer, so the queue cannot shrink underneath us.
+        records = [popleft() for _ in range(min(len(queue), self._max_insert_per_tick))]
+        if queue and not self._flush_pending:
+            self._flush_pending = True
+            self.after_idle(self._do_flush)
+        self._records.extend(records)
+        self._unrendered += len(records)
+        if not self._unrendered or not self.winfo_viewable():
+            # Nothing would be seen, so skip the Text work until the widget is shown again.
+            return
+
+        pending = min(self._unrendered, len(self._records))
+        self._unrendered = 0
+        if pending != len(records):
+            records = list(self._records)[-pending:]
+        if pending >= self.max_lines:
+            # Every visible line is stale; rebuild the view from the model.
+            self._clear_text()
+        self._flush(records)
 
     def update_widget(self, record):
         """
@@ -128,43 +354,175 @@ class LoguruWidget(ttk.Frame):
         Args:
             record (dict): A dictionary containing the log record information.
         """
+        self.queue.append(_make_record(_format_time(record["time"]), record["level"], record["message"]))
+        self._flush_queue()
+
+    def clear(self):
+        """Remove all log messages from the widget."""
+        self.queue.clear()
+        self._records.clear()
+        self._unrendered = 0
+        self._clear_text()
+
+    def _clear_text(self):
+        """Delete everything from the text widget."""
         self.text.configure(state=tk.NORMAL)
-        
-        time_str = record["time"].strftime("%Y-%m-%d %H:%M:%S")
-        level = record["level"]
-        message = record["message"]
-        
-        if self.color_mode == 'full':
-            self.text.insert(tk.END, f"{time_str} | {level:8} | {message}\n", level)
-        elif self.color_mode == 'message':
-            self.text.insert(tk.END, f"{time_str} | {level:8} | ", "")
-            self.text.insert(tk.END, f"{message}\n", level)
-        else:  # 'level' mode (default)
-            self.text.insert(tk.END, f"{time_str} | ", "")
-            self.text.insert(tk.END, f"{level:8}", level)
-            self.text.insert(tk.END, f" | {message}\n", "")
-        
-        if int(self.text.index('end-1c').split('.')[0]) > self.max_lines:
-            self.text.delete('1.0', '2.0')
-        
-        self.text.see(tk.END)
+        self.text.delete('1.0', tk.END)
         self.text.configure(state=tk.DISABLED)
+        self._line_count = 0
+
+    def _sync_line_count(self):
+        """
+        Re-read the line count from the text widget.
+
+        `_line_count` is otherwise maintained in Python so the insert path never has to ask
+        Tk for the end index; this only runs on rare events such as resizes.
+        """
+        self._line_count = int(self.text.index('end-1c').split('.')[0]) - 1
+
+    @property
+    def color_mode(self):
+        """str: The coloring mode for log messages: 'level', 'message', or 'full'."""
+        return self._color_mode
+
+    @color_mode.setter
+    def color_mode(self, mode):
+        self.set_color_mode(mode)
+
+    def set_color_mode(self, mode):
+        """
+        Set the coloring mode for log messages.
+
+        The matching formatter is picked here once, so flushing a batch does not compare
+        the mode for every record.
+
+        Args:
+            mode (str): 'level' to color the level name, 'message' to color the message,
+                        or 'full' to color the whole line. 'full' inserts queued lines untouched
+                        and is the recommended mode for high-throughput logging. Unknown modes
+                        fall back to 'level'.
+        """
+        self._color_mode = mode
+        self._color_mode_id = COLOR_MODES.get(mode, COLOR_MODES['level'])
+        self._formatter = (self._format_level, self._format_message, self._format_full)[self._color_mode_id]
+
+    @staticmethod
+    def _format_full(records):
+        """
+        Return `Text.insert` arguments coloring each whole line by its level.
+
+        This is the fast path: queued lines are used as-is, and each run of same-level
+        records becomes a single text argument.
+        """
+        args = []
+        for level, group in groupby(records, itemgetter(1)):
+            args.append("".join([record[0] for record in group]))
+            args.append(level)
+        return args
+
+    def _format_message(self, records):
+        """Return `Text.insert` arguments coloring only the message by its level."""
+        return _coalesce(self._message_chunks(records))
+
+    def _format_level(self, records):
+        """Return `Text.insert` arguments coloring only the level name."""
+        return _coalesce(self._level_chunks(records))
+
+    @staticmethod
+    def _message_chunks(records):
+        """Yield `(text, tag)` chunks coloring only the message by its level."""
+        for line, level, _, level_end in records:
+            yield line[:level_end + 3], ""
+            yield line[level_end + 3:], level
+
+    @staticmethod
+    def _level_chunks(records):
+        """Yield `(text, tag)` chunks coloring only the level name."""
+        for line, level, level_start, level_end in records:
+            yield line[:level_start], ""
+            yield line[level_start:level_end], level
+            yield line[level_end:], ""
+
+    def _flush(self, records):
+        """
+        Insert a batch of log records into the text widget.
+
+        Consecutive chunks sharing the same tag are joined and the batch is inserted with
+        a single Tcl command instead of several per record.
+
+        Args:
+            records (list): Record tuples built by `_make_record`, oldest first.
+        """
+        text = self.text
+        max_lines = self.max_lines
+        args = self._formatter(records)
+
+        # Only follow new output if the user has not scrolled up to read older messages.
+        at_bottom = text.yview()[1] >= 0.999
+
+        text.configure(state=tk.NORMAL)
+        # Text.insert is variadic in (chars, tagList) pairs per the Tk manual, so the
+        # whole batch goes across to Tcl in a single command.
+        text.insert(_LOG_END, *args)
+        # Count newlines rather than records: tracebacks and other multi-line messages span
+        # several lines of the text widget.
+        line_count = self._line_count + sum([chunk.count("\n") for chunk in args[::2]])
+
+        # Trim back to `max_lines` with one range delete per batch rather than deleting a
+        # single line (and querying the end index) on every insert.
+        overflow = line_count - max_lines
+        if overflow > 0:
+            text.delete('1.0', f'{overflow + 1}.0')
+            line_count = max_lines
+        self._line_count = line_count
+        
+        if at_bottom:
+            text.see(_LOG_END)
+        text.configure(state=tk.DISABLED)
 
     def sink(self, message):
         """
         A sink function to be used with loguru.
 
-        This method is called by loguru for each log message and puts the message into the queue.
+        This method is called by loguru for each log message and appends the message to the queue.
+        The display line is formatted here, on the logging thread, so the Tk thread only has to
+        slice and insert text. It never touches Tk; `check_queue` picks the record up.
 
         Args:
             message (loguru.Message): The log message object from loguru.
         """
         record = message.record
-        self.queue.put({
-            "time": record["time"],
-            "level": record["level"].name,
-            "message": record["message"]
-        })
+        if record["level"].no < self._min_level_no:
+            return
+        self.queue.append(_make_record(_format_time(record["time"]), record["level"].name, record["message"]))
+
+    def _add_sink(self, **kwargs):
+        """
+        Register this widget's `sink` with the loguru logger.
+
+        Args:
+            **kwargs: Additional keyword arguments to pass to `logger.add`.
+
+        Returns:
+            int: The loguru handler id.
+        """
+        # enqueue=True hands records to loguru's writer thread, so call sites (including the Tk
+        # thread) do not pay for the sink; the widget's deque is only ever appended to from there.
+        return logger.add(self.sink, enqueue=True, **kwargs)
+
+    def _remove_sink(self):
+        """
+        Unregister this widget's loguru handler, if it still has one.
+
+        The handler may already be gone, e.g. after another `setup_logger` call or an
+        application-wide `logger.remove()`.
+        """
+        handler_id, self._handler_id = self._handler_id, None
+        if handler_id is not None:
+            try:
+                logger.remove(handler_id)
+            except ValueError:
+                pass
 
     def set_color(self, level, color):
         """
@@ -176,29 +534,37 @@ class LoguruWidget(ttk.Frame):
                                   or a tuple of (foreground, background) colors.
         """
         self.log_colors[level] = color
-        self.update_tag_colors()
+        if isinstance(color, tuple):
+            self.text.tag_configure(level, foreground=color[0], background=color[1])
+        else:
+            self.text.tag_configure(level, foreground=color)
     
-    @staticmethod
-    def get_logging_level():
+    def get_logging_level(self):
         """
-        Get the current logging level.
+        Get the current logging level of this widget.
 
         Returns:
             str: The name of the current logging level.
         """
-        current_level_no = logger._core.min_level
-        current_level = LEVEL_NO_TO_NAME.get(current_level_no, "INFO")  # Default to INFO if level is not found
-        return current_level
+        return self._current_level
 
     def set_logging_level(self, level):
         """
-        Set the logging level for the loguru logger.
+        Set the minimum level displayed by this widget.
+
+        Only this widget's loguru handler is replaced, and its logging intercept handler (if any)
+        gets the same level; other sinks and the global logger configuration are left alone.
 
         Args:
             level (str): The name of the logging level to set.
         """
-        logger.remove()
-        logger.add(self.sink, level=level)
+        self._current_level = level
+        self._min_level_no = logger.level(level).no
+        if self._intercept_handler is not None:
+            self._intercept_handler.setLevel(self._min_level_no)
+        # Only replace this widget's own handler; other sinks the application added stay put.
+        self._remove_sink()
+        self._handler_id = self._add_sink(level=level, **self._sink_options)
 
     def pack(self, **kwargs):
         """Pack the widget and its children."""
@@ -222,17 +588,25 @@ class LoguruWidget(ttk.Frame):
         super().place(**kwargs)
 
     def destroy(self):
-        """Destroy the widget and stop the queue checking."""
+        """Destroy the widget, stop the queue checking and unregister its log handlers."""
         self._is_destroyed = True
-        super().destroy()
+        try:
+            # Removing the handler drains this widget's writer thread only, not every enqueued sink.
+            self._remove_sink()
+            if self._intercept_handler is not None:
+                logging.getLogger().removeHandler(self._intercept_handler)
+                self._intercept_handler = None
+        finally:
+            super().destroy()
 
     def process_all_events(self):
         """Process all pending events in the Tkinter event loop."""
-        while self.master.dooneevent(tk._tkinter.ALL_EVENTS | tk._tkinter.DONT_WAIT):
-            pass
+        # `update` already drains every pending event; looping on `dooneevent` as well could
+        # spin a CPU core when callers invoke this from their own loops.
+        self.update_idletasks()
         self.update()
 
-def setup_logger(widget):
+def setup_logger(widget, *, backtrace=False, diagnose=False, level='DEBUG'):
     """
     Set up the loguru logger to use the custom widget as a sink.
 
@@ -240,12 +614,24 @@ def setup_logger(widget):
 
     Args:
         widget (LoguruWidget): The widget to use as a sink for log messages.
+        backtrace (bool, optional): Whether loguru should extend exception tracebacks beyond the
+                                    catching frame. Defaults to False.
+        diagnose (bool, optional): Whether loguru should annotate tracebacks with variable values.
+                                   This walks frames and reprs locals, which is slow and can leak
+                                   sensitive values into the UI, so it is off by default; file or
+                                   console sinks are usually a better place for it. Defaults to False.
+        level (str, optional): The minimum level displayed by the widget. Defaults to 'DEBUG'.
     """
+    widget._sink_options = {"backtrace": backtrace, "diagnose": diagnose}
+    widget._current_level = level
+    widget._min_level_no = logger.level(level).no
     logger.remove()
-    logger.add(widget.sink, backtrace=True, diagnose=True)
+    widget._handler_id = widget._add_sink(level=level, **widget._sink_options)
     
-    if widget.intercept_logging:
-        logging.getLogger().addHandler(LoggingInterceptHandler(widget))
+    if widget.intercept_logging and widget._intercept_handler is None:
+        widget._intercept_handler = LoggingInterceptHandler(widget)
+        widget._intercept_handler.setLevel(widget._min_level_no)
+        logging.getLogger().addHandler(widget._intercept_handler)
         logging.getLogger().setLevel(logging.DEBUG)
 
 
@@ -286,10 +672,12 @@ if __name__ == "__main__":
     generate_logs_button = ttk.Button(button_frame, text="Generate Sample Logs", command=generate_sample_logs)
     generate_logs_button.pack(side=tk.LEFT, padx=5)
 
+    next_color_mode = {'level': 'full', 'full': 'message', 'message': 'level'}
+    next_level = dict(zip(LEVELS, LEVELS[1:] + LEVELS[:1]))
+
     def change_color_mode():
         """Change the color mode of the log widget."""
-        current_mode = log_widget.color_mode
-        new_mode = 'full' if current_mode == 'level' else 'level' if current_mode == 'message' else 'message'
+        new_mode = next_color_mode[log_widget.color_mode]
         log_widget.color_mode = new_mode
         
         current_level = log_widget.get_logging_level()
@@ -302,9 +690,7 @@ if __name__ == "__main__":
     def change_log_level():
         """Change the logging level of the log widget."""
         current_level = log_widget.get_logging_level()
-        current_index = LEVELS.index(current_level)
-        new_index = (current_index + 1) % len(LEVELS)
-        new_level = LEVELS[new_index]
+        new_level = next_level[current_level]
         
         log_widget.set_logging_level(new_level)
         log_func = getattr(logger, new_level.lower())